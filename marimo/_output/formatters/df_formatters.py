@@ -103,8 +103,9 @@ class PolarsFormatter(FormatterFactory):
         ) -> tuple[KnownMimeType, str]:
             try:
                 # Table need a column name for operations
+                # to_frame wraps the series without copying its data
                 if series.name is None or series.name == "":
-                    df = pl.DataFrame({"value": series})
+                    df = series.to_frame(name="value")
                 else:
                     df = series.to_frame()
                 return table(df, selection=None, pagination=True)._mime_()
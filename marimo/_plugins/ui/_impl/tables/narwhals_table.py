@@ -1,8 +1,8 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
-import functools
 import io
+from enum import Enum
 from functools import cached_property
 from typing import Any, Optional, Union, cast
 
@@ -40,6 +40,21 @@ from marimo._utils.narwhals_utils import (
 
 LOGGER = _loggers.marimo_logger()
 
+# Cached PIL.Image.Image class, resolved once Pillow has been imported
+_PIL_IMAGE_CLASS: Optional[type[Any]] = None
+
+
+def _get_pil_image_class() -> Optional[type[Any]]:
+    """Get the Pillow image class, or None if Pillow is not imported."""
+    global _PIL_IMAGE_CLASS
+    # Pillow may be imported after this module, so keep checking until
+    # it has been imported
+    if _PIL_IMAGE_CLASS is None and DependencyManager.pillow.imported():
+        from PIL import Image
+
+        _PIL_IMAGE_CLASS = Image.Image
+    return _PIL_IMAGE_CLASS
+
 
 class NarwhalsTableManager(
     TableManager[Union[nw.DataFrame[IntoFrameT], nw.LazyFrame[IntoFrameT]]]
@@ -82,7 +97,12 @@ class NarwhalsTableManager(
     def to_json_str(
         self, format_mapping: Optional[FormatMapping] = None
     ) -> str:
-        frame = self.upgrade().apply_formatting(format_mapping).as_frame()
+        # Serialize the rows directly; apply_formatting already upgrades
+        # the frame, so we only need to upgrade when there is no formatting.
+        if format_mapping:
+            frame = self.apply_formatting(format_mapping).as_frame()
+        else:
+            frame = self.upgrade().as_frame()
         return sanitize_json_bigint(frame.rows(named=True))
 
     def to_parquet(self) -> bytes:
@@ -90,6 +110,21 @@ class NarwhalsTableManager(
         self.as_frame().write_parquet(stream)
         return stream.getvalue()
 
+    def to_arrow_ipc(self) -> bytes:
+        # PyArrow tables are already in Arrow memory, so they can be
+        # written to IPC without a conversion. Other backends fall back
+        # to the default, which lets callers fall back to CSV.
+        if not self.data.implementation.is_pyarrow():
+            return super().to_arrow_ipc()
+
+        import pyarrow as pa  # type: ignore[import-not-found]
+
+        table = cast("pa.Table", self.data.to_native())
+        out = io.BytesIO()
+        with pa.ipc.new_file(out, table.schema) as writer:
+            writer.write_table(table)
+        return out.getvalue()
+
     def apply_formatting(
         self, format_mapping: Optional[FormatMapping]
     ) -> NarwhalsTableManager[Any]:
@@ -97,15 +132,24 @@ class NarwhalsTableManager(
             return self
 
         frame = self.upgrade().as_frame()
-        _data = frame.to_dict(as_series=False).copy()
-        for col in _data.keys():
-            if col in format_mapping:
-                _data[col] = [
-                    format_value(col, x, format_mapping) for x in _data[col]
-                ]
-        return NarwhalsTableManager(
-            nw.from_dict(_data, backend=nw.get_native_namespace(frame))
-        )
+        native_namespace = nw.get_native_namespace(frame)
+        # Only materialize the columns being formatted; the rest of the
+        # frame stays in its native representation.
+        formatted_columns = [
+            nw.new_series(
+                col,
+                [
+                    format_value(col, x, format_mapping)
+                    for x in frame[col].to_list()
+                ],
+                backend=native_namespace,
+            )
+            for col in self.nw_schema
+            if col in format_mapping
+        ]
+        if not formatted_columns:
+            return NarwhalsTableManager(frame)
+        return NarwhalsTableManager(frame.with_columns(formatted_columns))
 
     def supports_filters(self) -> bool:
         return True
@@ -115,7 +159,7 @@ class NarwhalsTableManager(
             return self.with_new_data(self.data.head(0))
 
         # Prefer the index column for selections
-        if INDEX_COLUMN_NAME in self.nw_schema.names():
+        if INDEX_COLUMN_NAME in self.nw_schema:
             # Drop the index column before returning
             return self.with_new_data(
                 self.data.filter(nw.col(INDEX_COLUMN_NAME).is_in(indices))
@@ -132,18 +176,24 @@ class NarwhalsTableManager(
             return []
 
         df = self.as_frame()
-        if INDEX_COLUMN_NAME in df.columns:
+        if INDEX_COLUMN_NAME in self.nw_schema:
+            # Filter all requested rows in a single pass, then look up
+            # each cell by its position in the filtered frame
+            wanted_rows = sorted({int(row) for row, _ in cells})
+            filtered = df.filter(
+                nw.col(INDEX_COLUMN_NAME).is_in(wanted_rows)
+            ).to_dict(as_series=False)
+            row_positions = {
+                row_id: position
+                for position, row_id in enumerate(filtered[INDEX_COLUMN_NAME])
+            }
+
             selection: list[TableCell] = []
             for row, col in cells:
-                filtered: nw.DataFrame[Any] = df.filter(
-                    nw.col(INDEX_COLUMN_NAME) == int(row)
-                )
-                if filtered.is_empty():
+                position = row_positions.get(int(row))
+                if position is None:
                     continue
-
-                selection.append(
-                    TableCell(row, col, filtered.get_column(col)[0])
-                )
+                selection.append(TableCell(row, col, filtered[col][position]))
 
             return selection
         else:
@@ -160,11 +210,23 @@ class NarwhalsTableManager(
     ) -> list[str]:
         return []
 
-    @functools.lru_cache(maxsize=5)  # noqa: B019
+    @cached_property
+    def _top_k_cache(self) -> dict[tuple[ColumnName, int], list[Any]]:
+        # Managers are immutable, so results can be cached per instance
+        return {}
+
     def calculate_top_k_rows(
         self, column: ColumnName, k: int
     ) -> list[tuple[Any, int]]:
-        if column not in self.get_column_names():
+        key = (column, k)
+        if key not in self._top_k_cache:
+            self._top_k_cache[key] = self._compute_top_k_rows(column, k)
+        return self._top_k_cache[key]
+
+    def _compute_top_k_rows(
+        self, column: ColumnName, k: int
+    ) -> list[tuple[Any, int]]:
+        if column not in self._column_names:
             raise ValueError(f"Column {column} not found in table.")
 
         frame = self.as_lazy_frame()
@@ -173,6 +235,9 @@ class NarwhalsTableManager(
         def _calculate_top_k_rows(
             df: nw.DataFrame[Any] | nw.LazyFrame[Any],
         ) -> nw.DataFrame[Any]:
+            # Ties are broken by value so the result is deterministic.
+            # On lazy polars frames the head is pushed into the sort, so
+            # this is already a bounded top-k rather than a full sort.
             result = (
                 df.group_by(column)
                 .agg(nw.len().alias(_unique_name))
@@ -225,6 +290,10 @@ class NarwhalsTableManager(
     def nw_schema(self) -> nw.Schema:
         return cast(nw.Schema, self.data.collect_schema())
 
+    @cached_property
+    def _native_namespace(self) -> Any:
+        return nw.get_native_namespace(self.data)
+
     def get_field_type(
         self, column_name: str
     ) -> tuple[FieldType, ExternalDataType]:
@@ -257,26 +326,31 @@ class NarwhalsTableManager(
         if offset < 0:
             raise ValueError("Offset must be a non-negative integer")
 
-        if offset == 0:
-            return self.with_new_data(self.data.head(count))
-        else:
-            if is_narwhals_lazyframe(self.data):
-                # Lazyframes do not support slicing, https://github.com/narwhals-dev/narwhals/issues/2389
-                # So we collect the first n rows
-                data = self.data.head(offset + count).collect()
-                return self.with_new_data(data[offset : offset + count])
-            else:
-                return self.with_new_data(self.data[offset : offset + count])
+        if is_narwhals_lazyframe(self.data):
+            if offset == 0:
+                return self.with_new_data(self.data.head(count))
+            # Lazyframes do not support slicing, https://github.com/narwhals-dev/narwhals/issues/2389
+            # So we collect the first n rows
+            data = self.data.head(offset + count).collect()
+            return self.with_new_data(data[offset : offset + count])
+
+        # Slicing an eager frame is a zero-copy view on the native data
+        return self.with_new_data(self.data[offset : offset + count])
 
     def search(self, query: str) -> TableManager[Any]:
-        query = query.lower()
+        # An empty or whitespace-only query would match every row
+        if not query.strip():
+            return self
+
+        # Build the case-insensitive pattern once and reuse it for every column
+        pattern = f"(?i){query.lower()}"
 
         expressions: list[Any] = []
         for column, dtype in self.nw_schema.items():
             if column == INDEX_COLUMN_NAME:
                 continue
             if dtype == nw.String:
-                expressions.append(nw.col(column).str.contains(f"(?i){query}"))
+                expressions.append(nw.col(column).str.contains(pattern))
             elif dtype == nw.List(nw.String):
                 # TODO: Narwhals doesn't support list.contains
                 # expressions.append(
@@ -289,21 +363,16 @@ class NarwhalsTableManager(
                 or dtype == nw.Boolean
             ):
                 expressions.append(
-                    nw.col(column).cast(nw.String).str.contains(f"(?i){query}")
+                    nw.col(column).cast(nw.String).str.contains(pattern)
                 )
 
         if not expressions:
             return NarwhalsTableManager(self.data.filter(nw.lit(False)))
 
-        or_expr = expressions[0]
-        for expr in expressions[1:]:
-            or_expr = or_expr | expr
-
-        filtered = self.data.filter(or_expr)
+        filtered = self.data.filter(nw.any_horizontal(*expressions))
         return NarwhalsTableManager(filtered)
 
     def get_stats(self, column: str) -> ColumnStats:
-        stats = self._get_stats_internal(column)
         import warnings
 
         with warnings.catch_warnings():
@@ -312,11 +381,13 @@ class NarwhalsTableManager(
                 message="Discarding nonzero nanoseconds in conversion",
                 category=UserWarning,
             )
+            if column not in self._stats_cache:
+                self._stats_cache[column] = self._get_stats_internal(column)
+            return self._stats_cache[column]
 
-            for key, value in stats.__dict__.items():
-                if value is not None:
-                    stats.__dict__[key] = unwrap_py_scalar(value)
-        return stats
+    @cached_property
+    def _stats_cache(self) -> dict[str, ColumnStats]:
+        return {}
 
     def _get_stats_internal(self, column: str) -> ColumnStats:
         # If column is not in the dataframe, return empty stats
@@ -337,12 +408,9 @@ class NarwhalsTableManager(
         if is_narwhals_string_type(dtype):
             exprs["unique"] = col.n_unique()
         elif dtype == nw.Boolean:
-            exprs.update(
-                {
-                    "true": col.sum(),  # type: ignore[dict-item]
-                    "false": nw.len() - col.sum(),  # type: ignore[dict-item]
-                }
-            )
+            # "false" is derived from "total" and "true" after collecting,
+            # so the column is only summed once
+            exprs["true"] = col.sum()  # type: ignore[assignment]
         elif (dtype == nw.Date) or is_narwhals_time_type(dtype):
             exprs.update(
                 {
@@ -428,8 +496,21 @@ class NarwhalsTableManager(
                 }
             )
 
+        # Collect all aggregates together in a single select
         stats = frame.select(**exprs)
-        stats_dict = stats.collect().rows(named=True)[0]
+        # Convert to python scalars as the single row is extracted
+        stats_dict = {
+            key: unwrap_py_scalar(value)
+            for key, value in stats.collect().rows(named=True)[0].items()
+        }
+
+        if "true" in stats_dict:
+            true_count = stats_dict["true"]
+            stats_dict["false"] = (
+                None
+                if true_count is None
+                else stats_dict["total"] - true_count
+            )
 
         # Maybe add units to the stats
         for key, value in stats_dict.items():
@@ -441,7 +522,10 @@ class NarwhalsTableManager(
     def get_num_rows(self, force: bool = True) -> Optional[int]:
         # If force is true, collect the data and get the number of rows
         if force:
-            return self.as_frame().shape[0]
+            if is_narwhals_lazyframe(self.data):
+                # Only collect the row count, not the whole frame
+                return cast(int, self.data.select(nw.len()).collect().item())
+            return self.data.shape[0]
 
         # When lazy, we don't know the number of rows
         if is_narwhals_lazyframe(self.data):
@@ -455,25 +539,35 @@ class NarwhalsTableManager(
             return None
 
     def get_num_columns(self) -> int:
-        return len(self.get_column_names())
+        return len(self._column_names)
 
     def get_column_names(self) -> list[str]:
-        column_names = self.nw_schema.names()
-        if INDEX_COLUMN_NAME in column_names:
-            column_names.remove(INDEX_COLUMN_NAME)
-        return column_names
+        # Return a copy since callers may mutate the list
+        return list(self._column_names)
+
+    @cached_property
+    def _column_names(self) -> list[str]:
+        return [
+            name
+            for name in self.nw_schema.names()
+            if name != INDEX_COLUMN_NAME
+        ]
 
     def get_unique_column_values(self, column: str) -> list[str | int | float]:
         frame = self.data.select(nw.col(column))
         if isinstance(frame, nw.LazyFrame):
             frame = frame.collect()
+        series = frame[column]
         try:
-            return frame[column].unique().to_list()
+            return series.unique().to_list()
         except BaseException:
             # Catch-all: some libraries like Polars have bugs and raise
             # BaseExceptions, which shouldn't crash the kernel
-            # If an exception occurs, try converting to strings first
-            return frame[column].cast(nw.String).unique().to_list()
+            # If an exception occurs, try converting to strings first.
+            # Whether unique() fails depends on the backend and the values
+            # (e.g. pandas object columns holding lists), not just the dtype,
+            # so this can't be decided up front from the schema.
+            return series.cast(nw.String).unique().to_list()
 
     def get_sample_values(self, column: str) -> list[str | int | float]:
         # Skip lazy frames
@@ -482,34 +576,35 @@ class NarwhalsTableManager(
 
         # Sample 3 values from the column
         SAMPLE_SIZE = 3
+
+        def to_primitive(value: Any) -> str | int | float:
+            if isinstance(value, list):
+                return str([to_primitive(v) for v in value])
+            elif isinstance(value, dict):
+                return str({k: to_primitive(v) for k, v in value.items()})
+            elif isinstance(value, Enum):
+                return value.name
+            elif isinstance(value, (float, int)):
+                return value
+            return str(value)
+
         try:
-            from enum import Enum
-
-            def to_primitive(value: Any) -> str | int | float:
-                if isinstance(value, list):
-                    return str([to_primitive(v) for v in value])
-                elif isinstance(value, dict):
-                    return str({k: to_primitive(v) for k, v in value.items()})
-                elif isinstance(value, Enum):
-                    return value.name
-                elif isinstance(value, (float, int)):
-                    return value
-                return str(value)
-
-            if self.data[column].dtype == nw.Datetime:
+            dtype = self.nw_schema[column]
+            values = self.data[column].head(SAMPLE_SIZE)
+            if dtype == nw.Datetime:
                 # Drop timezone info for datetime columns
                 # It's ok to drop timezone since these are just sample values
                 # and not used for any calculations
-                values = (
-                    self.data[column]
-                    .dt.replace_time_zone(None)
-                    .head(SAMPLE_SIZE)
-                    .to_list()
-                )
-            else:
-                values = self.data[column].head(SAMPLE_SIZE).to_list()
+                values = values.dt.replace_time_zone(None)
+            sample_values = values.to_list()
+
+            # Numeric and boolean values are already primitives
+            # (bool is a subclass of int). Checking the values rather than
+            # the dtype keeps nulls, like None or pandas' NA, serialized
+            if all(isinstance(v, (int, float)) for v in sample_values):
+                return sample_values
             # Serialize values to primitives
-            return [to_primitive(v) for v in values]
+            return [to_primitive(v) for v in sample_values]
         except BaseException:
             # Catch-all: some libraries like Polars have bugs and raise
             # BaseExceptions, which shouldn't crash the kernel
@@ -531,7 +626,7 @@ class NarwhalsTableManager(
     def __repr__(self) -> str:
         rows = self.get_num_rows(force=False)
         columns = self.get_num_columns()
-        df_type = str(nw.get_native_namespace(self.data).__name__)
+        df_type = str(self._native_namespace.__name__)
         if rows is None:
             return f"{df_type}: {columns:,} columns"
         return f"{df_type}: {rows:,} rows x {columns:,} columns"
@@ -547,9 +642,7 @@ class NarwhalsTableManager(
             return None
 
         # Handle Pillow images
-        if DependencyManager.pillow.imported():
-            from PIL import Image
-
-            if isinstance(value, Image.Image):
-                return io_to_data_url(value, "image/png")
+        image_class = _get_pil_image_class()
+        if image_class is not None and isinstance(value, image_class):
+            return io_to_data_url(value, "image/png")
         return value
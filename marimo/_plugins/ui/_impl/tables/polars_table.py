@@ -194,6 +194,10 @@ class PolarsTableManagerFactory(TableManagerFactory):
                 return isinstance(value, (pl.DataFrame, pl.LazyFrame))
 
             def search(self, query: str) -> PolarsTableManager:
+                # An empty or whitespace-only query would match every row
+                if not query.strip():
+                    return self
+
                 query = query.lower()
 
                 expressions: list[pl.Expr] = []
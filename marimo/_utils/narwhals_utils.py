@@ -47,6 +47,10 @@ def assert_narwhals_series(series: nw.Series) -> None:
         raise ValueError(f"Unsupported series type. Got {type(series)}")
 
 
+# Builtin types that are never dataframes
+_NON_FRAME_TYPES = (str, bytes, bool, int, float, list, tuple, dict, set)
+
+
 def can_narwhalify(
     obj: Any, *, eager_only: bool = False
 ) -> TypeGuard[IntoFrame]:
@@ -55,6 +59,17 @@ def can_narwhalify(
     """
     if obj is None:
         return False
+    # Cheap checks for common values before constructing a narwhals wrapper
+    if isinstance(obj, _NON_FRAME_TYPES):
+        return False
+    if (
+        nw.dependencies.is_pandas_dataframe(obj)
+        or nw.dependencies.is_polars_dataframe(obj)
+        or nw.dependencies.is_pyarrow_table(obj)
+    ):
+        return True
+    if not eager_only and nw.dependencies.is_polars_lazyframe(obj):
+        return True
     try:
         nw.from_native(obj, strict=True, eager_only=eager_only)  # type: ignore[call-overload]
         return True
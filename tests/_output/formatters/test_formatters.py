@@ -460,6 +460,24 @@ def test_display_protocol_takes_precedence() -> None:
     assert content == "<span>foo</span>"
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_polars_series_renders_table() -> None:
+    register_formatters()
+
+    import polars as pl
+
+    for series, column in [
+        (pl.Series([1, 2, 3]), "value"),
+        (pl.Series("A", [1, 2, 3]), "A"),
+    ]:
+        formatter = get_formatter(series)
+        assert formatter is not None
+        mimetype, contents = formatter(series)
+        assert mimetype == "text/html"
+        assert "<marimo-table" in contents
+        assert column in contents
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 def test_lazyframe_renders_mermaid_html() -> None:
     register_formatters()
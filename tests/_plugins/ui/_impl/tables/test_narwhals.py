@@ -15,6 +15,7 @@ from marimo._plugins.ui._impl.tables.format import FormatMapping
 from marimo._plugins.ui._impl.tables.narwhals_table import (
     NarwhalsTableManager,
 )
+from marimo._plugins.ui._impl.tables.selection import INDEX_COLUMN_NAME
 from marimo._plugins.ui._impl.tables.table_manager import (
     TableCell,
     TableCoordinate,
@@ -453,6 +454,9 @@ class TestNarwhalsTableManagerFactory(unittest.TestCase):
         # TODO: Unsupported by narwhals
         assert manager.search("yyy").get_num_rows() == 0
         assert manager.search("y").get_num_rows() == 0
+        # Empty or whitespace-only query
+        assert manager.search("") is manager
+        assert manager.search("   ") is manager
 
     def test_apply_formatting_does_not_modify_original_data(self) -> None:
         original_data = self.data.clone()
@@ -806,6 +810,27 @@ def test_to_parquet(df: Any) -> None:
     assert isinstance(manager.to_parquet(), bytes)
 
 
+@pytest.mark.skipif(
+    not DependencyManager.pyarrow.has(), reason="pyarrow not installed"
+)
+def test_to_arrow_ipc() -> None:
+    import pyarrow as pa
+
+    table = pa.table({"A": [1, 2, 3], "B": ["a", "b", "c"]})
+    manager = NarwhalsTableManager.from_dataframe(table)
+    ipc = manager.to_arrow_ipc()
+    assert pa.ipc.open_file(pa.py_buffer(ipc)).read_all().equals(table)
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_to_arrow_ipc_not_implemented_for_other_backends() -> None:
+    import polars as pl
+
+    manager = NarwhalsTableManager.from_dataframe(pl.DataFrame({"A": [1]}))
+    with pytest.raises(NotImplementedError):
+        manager.to_arrow_ipc()
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 @pytest.mark.parametrize(
     "df",
@@ -1082,6 +1107,25 @@ def test_calculate_top_k_rows(df: Any) -> None:
     assert normalized_result == [(3, 3), (None, 2)]
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"A": ["b", "c", "a", "b", "a", "c", "d"]},
+        include=SUPPORTED_LIBS,
+    ),
+)
+def test_calculate_top_k_rows_breaks_ties_by_value(df: Any) -> None:
+    manager = NarwhalsTableManager.from_dataframe(df)
+    assert manager.calculate_top_k_rows("A", 2) == [("a", 2), ("b", 2)]
+    assert manager.calculate_top_k_rows("A", 4) == [
+        ("a", 2),
+        ("b", 2),
+        ("c", 2),
+        ("d", 1),
+    ]
+
+
 @pytest.mark.skipif(
     not DependencyManager.ibis.has(),
     reason="Ibis not installed",
@@ -1165,6 +1209,38 @@ def test_get_sample_values_with_metadata_only_frame(df: Any) -> None:
     assert sample_values == []
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_get_sample_values_with_nulls() -> None:
+    import pandas as pd
+    import polars as pl
+
+    # Pandas nullable dtypes use pd.NA for missing values
+    manager = NarwhalsTableManager.from_dataframe(
+        pd.DataFrame(
+            {
+                "ints": pd.array([1, None, 3], dtype="Int64"),
+                "bools": pd.array([True, None, False], dtype="boolean"),
+            }
+        )
+    )
+    assert manager.get_sample_values("ints") == [1, "<NA>", 3]
+    assert manager.get_sample_values("bools") == [True, "<NA>", False]
+    json.dumps(manager.get_sample_values("ints"))
+
+    # Polars uses None for missing values
+    manager = NarwhalsTableManager.from_dataframe(
+        pl.DataFrame({"ints": [1, None, 3]})
+    )
+    assert manager.get_sample_values("ints") == [1, "None", 3]
+
+    # Columns without nulls are returned as-is
+    manager = NarwhalsTableManager.from_dataframe(
+        pl.DataFrame({"ints": [1, 2, 3], "bools": [True, False, True]})
+    )
+    assert manager.get_sample_values("ints") == [1, 2, 3]
+    assert manager.get_sample_values("bools") == [True, False, True]
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 def test_get_sample_values_returns_primitives() -> None:
     """Test that get_sample_values always returns primitive types."""
@@ -1302,3 +1378,105 @@ def test_calculate_top_k_rows_cache_invalidation(df: Any) -> None:
 
     # Verify the actual results are different
     assert result1 != result2
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {INDEX_COLUMN_NAME: [0, 1], "name": ["Alice", "Eve"], "age": [25, 35]}
+    ),
+)
+def test_get_column_names_excludes_index_and_returns_copy(df: Any) -> None:
+    manager = NarwhalsTableManager.from_dataframe(df)
+    column_names = manager.get_column_names()
+    assert column_names == ["name", "age"]
+    assert manager.get_num_columns() == 2
+
+    # Mutating the returned list should not affect the manager
+    column_names.append("extra")
+    assert manager.get_column_names() == ["name", "age"]
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {INDEX_COLUMN_NAME: [3, 1, 2], "name": ["Alice", "Bob", "Eve"]},
+        include=SUPPORTED_LIBS,
+    ),
+)
+def test_select_cells_with_index_column(df: Any) -> None:
+    manager = NarwhalsTableManager.from_dataframe(df)
+    cells = [
+        TableCoordinate(row_id=2, column_name="name"),
+        TableCoordinate(row_id="3", column_name="name"),
+        # Missing rows are skipped
+        TableCoordinate(row_id=10, column_name="name"),
+        TableCoordinate(row_id=2, column_name=INDEX_COLUMN_NAME),
+    ]
+    assert manager.select_cells(cells) == [
+        TableCell(row=2, column="name", value="Eve"),
+        TableCell(row="3", column="name", value="Alice"),
+        TableCell(row=2, column=INDEX_COLUMN_NAME, value=2),
+    ]
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"name": ["Alice", "Eve", None], "age": [25, 35, None]},
+        exclude=["ibis", "duckdb"],
+    ),
+)
+def test_get_stats_caching(df: Any) -> None:
+    """Test that column stats are cached per column."""
+    manager = NarwhalsTableManager.from_dataframe(df)
+    stats1 = manager.get_stats("age")
+
+    # Same column should return the cached result
+    stats2 = manager.get_stats("age")
+    assert stats1 is stats2
+
+    # Different column should compute a new result
+    stats3 = manager.get_stats("name")
+    assert stats3 is not stats1
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_get_unique_column_values_nested() -> None:
+    import pandas as pd
+    import polars as pl
+
+    # Polars can compute unique values of nested columns natively
+    manager = NarwhalsTableManager.from_dataframe(
+        pl.DataFrame({"A": [[1, 2], [1, 2], [3]]})
+    )
+    assert sorted(manager.get_unique_column_values("A")) == [[1, 2], [3]]
+
+    # Pandas object columns holding lists are unhashable, so they fall
+    # back to string values
+    manager = NarwhalsTableManager.from_dataframe(
+        pd.DataFrame({"A": [[1, 2], [1, 2]]})
+    )
+    assert manager.get_unique_column_values("A") == ["[1, 2]"]
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_cached_results_do_not_keep_manager_alive() -> None:
+    import gc
+    import weakref
+
+    import polars as pl
+
+    manager = NarwhalsTableManager.from_dataframe(
+        pl.DataFrame({"name": ["Alice", "Eve", "Eve"]})
+    )
+    manager.calculate_top_k_rows("name", 10)
+    manager.get_stats("name")
+
+    ref = weakref.ref(manager)
+    del manager
+    gc.collect()
+    assert ref() is None
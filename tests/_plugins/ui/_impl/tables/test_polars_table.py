@@ -491,6 +491,9 @@ class TestPolarsTableManagerFactory(unittest.TestCase):
         # List (exact match)
         assert manager.search("yyy").get_num_rows() == 1
         assert manager.search("y").get_num_rows() == 0
+        # Empty or whitespace-only query
+        assert manager.search("") is manager
+        assert manager.search("   ") is manager
 
     def test_apply_formatting_does_not_modify_original_data(self) -> None:
         original_data = self.data.clone()
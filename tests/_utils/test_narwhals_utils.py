@@ -77,7 +77,13 @@ def test_can_narwhalify():
 
     assert can_narwhalify([1, 2, 3]) is False
     assert can_narwhalify({"a": 1, "b": 2}) is False
+    assert can_narwhalify("a,b\n1,2") is False
     assert can_narwhalify(pl.DataFrame({"a": [1, 2, 3]})) is True
+    assert can_narwhalify(pl.Series([1, 2, 3])) is False
+
+    lazy_df = pl.DataFrame({"a": [1, 2, 3]}).lazy()
+    assert can_narwhalify(lazy_df) is True
+    assert can_narwhalify(lazy_df, eager_only=True) is False
 
 
 @pytest.mark.parametrize(